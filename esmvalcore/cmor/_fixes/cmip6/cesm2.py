@@ -6,12 +6,12 @@ from netCDF4 import Dataset
 
 from ..fix import Fix
 from ..shared import (
-    add_scalar_depth_coord,
     add_scalar_height_coord,
     add_scalar_typeland_coord,
     add_scalar_typesea_coord,
     fix_ocean_depth_coord,
 )
+from .gfdl_esm4 import Fgco2 as BaseFgco2
 from .gfdl_esm4 import Siconc as Addtypesi
 
 
@@ -92,26 +92,9 @@ Cli = Cl
 Clw = Cl
 
 
-class Fgco2(Fix):
+class Fgco2(BaseFgco2):
     """Fixes for fgco2."""
 
-    def fix_metadata(self, cubes):
-        """Add depth (0m) coordinate.
-
-        Parameters
-        ----------
-        cubes : iris.cube.CubeList
-            Input cubes.
-
-        Returns
-        -------
-        iris.cube.CubeList
-
-        """
-        cube = self.get_cube_from_list(cubes)
-        add_scalar_depth_coord(cube)
-        return cubes
-
 
 class Prw(Fix):
     """Fixes for tas."""
@@ -1,6 +1,4 @@
 """Fixes for GFDL-CM4 model."""
-import iris
-
 from ..common import ClFixHybridPressureCoord
 from ..fix import Fix
 from ..shared import add_aux_coords_from_cubes, add_scalar_height_coord
@@ -56,9 +54,7 @@ class Tas(Fix):
 
         """
         cube = self.get_cube_from_list(cubes)
-        try:
-            cube.coord('height')
-        except iris.exceptions.CoordinateNotFoundError:
+        if not cube.coords('height'):
             add_scalar_height_coord(cube, 2.0)
         return cubes
 
@@ -85,23 +81,5 @@ class Uas(Fix):
         return cubes
 
 
-class Vas(Fix):
+class Vas(Uas):
     """Fixes for vas."""
-
-    def fix_metadata(self, cubes):
-        """
-        Add height (10m) coordinate.
-
-        Parameters
-        ----------
-        cubes : iris.cube.CubeList
-            Input cubes.
-
-        Returns
-        -------
-        iris.cube.CubeList
-
-        """
-        cube = self.get_cube_from_list(cubes)
-        add_scalar_height_coord(cube, 10.0)
-        return cubes
@@ -15,6 +15,8 @@ from ._validated_config import ValidatedConfig
 URL = ('https://docs.esmvaltool.org/projects/'
        'ESMValCore/en/latest/quickstart/configure.html')
 
+TIME_FORMAT = "%Y%m%d_%H%M%S"
+
 
 class Config(ValidatedConfig):
     """ESMValTool configuration object.
@@ -143,7 +145,7 @@ class Session(ValidatedConfig):
         The `name` is used to name the session directory, e.g.
         `session_20201208_132800/`. The date is suffixed automatically.
         """
-        now = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        now = datetime.utcnow().strftime(TIME_FORMAT)
         self.session_name = f"{name}_{now}"
 
     @property
@@ -1,5 +1,6 @@
 """List of config validators."""
 
+import os.path
 import warnings
 from collections.abc import Iterable
 from functools import lru_cache
@@ -11,6 +12,11 @@ from esmvalcore._recipe import TASKSEP
 from esmvalcore.cmor.check import CheckLevels
 
 
+#: Set types are rejected by `_listify_validator` because their iteration
+#: order is non-deterministic.
+_SET_TYPES = (set, frozenset)
+
+
 class ValidationError(ValueError):
     """Custom validation error."""
 
@@ -55,7 +61,7 @@ def _make_type_validator(cls, *, allow_none=False):
 # to fit the needs of ESMValCore. Matplotlib is licenced under the terms of
 # the the 'Python Software Foundation License'
 # (https://www.python.org/psf/license)
-@lru_cache()
+@lru_cache(maxsize=None)
 def _listify_validator(scalar_validator,
                        allow_stringlist=False,
                        *,
@@ -81,8 +87,7 @@ def _listify_validator(scalar_validator,
                     raise
         # Allow any ordered sequence type -- generators, np.ndarray, pd.Series
         # -- but not sets, whose iteration order is non-deterministic.
-        elif isinstance(inp,
-                        Iterable) and not isinstance(inp, (set, frozenset)):
+        elif isinstance(inp, Iterable) and not isinstance(inp, _SET_TYPES):
             # The condition on this list comprehension will preserve the
             # behavior of filtering out any empty strings (behavior was
             # from the original validate_stringlist()), while allowing
@@ -113,17 +118,29 @@ def _listify_validator(scalar_validator,
 
 def validate_bool(value, allow_none=False):
     """Check if the value can be evaluate as a boolean."""
+    if isinstance(value, bool):
+        return value
     if (value is None) and allow_none:
         return value
-    if not isinstance(value, bool):
-        raise ValidationError(f"Could not convert `{value}` to `bool`")
-    return value
+    raise ValidationError(f"Could not convert `{value}` to `bool`")
+
+
+@lru_cache(maxsize=1024)
+def _expand_path(value: str) -> Path:
+    """Return an absolute `Path` for an absolute path string (cached)."""
+    return Path(value).expanduser().absolute()
 
 
 def validate_path(value, allow_none=False):
     """Return a `Path` object."""
     if (value is None) and allow_none:
         return value
+    if isinstance(value, (str, Path)):
+        value_str = str(value)
+        # Relative paths depend on the working directory, so only
+        # absolute paths can be cached safely.
+        if os.path.isabs(os.path.expanduser(value_str)):
+            return _expand_path(value_str)
     try:
         path = Path(value).expanduser().absolute()
     except TypeError as err:
@@ -210,10 +227,18 @@ def validate_check_level(value):
     return value
 
 
+@lru_cache(maxsize=256)
+def _validate_diagnostics_str(diagnostics: str) -> frozenset:
+    """Validate diagnostic location given as a single string (cached)."""
+    return frozenset(
+        pattern if TASKSEP in pattern else pattern + TASKSEP + '*'
+        for pattern in diagnostics.strip().split(' '))
+
+
 def validate_diagnostics(diagnostics):
     """Validate diagnostic location."""
     if isinstance(diagnostics, str):
-        diagnostics = diagnostics.strip().split(' ')
+        return set(_validate_diagnostics_str(diagnostics))
     return {
         pattern if TASKSEP in pattern else pattern + TASKSEP + '*'
         for pattern in diagnostics or ()
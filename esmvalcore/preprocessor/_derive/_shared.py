@@ -15,17 +15,11 @@ logger = logging.getLogger(__name__)
 def cloud_area_fraction(cubes, tau_constraint, plev_constraint):
     """Calculate cloud area fraction for different parameters."""
     clisccp_cube = cubes.extract_cube(var_name_constraint('clisccp'))
-    new_cube = clisccp_cube
-    new_cube = new_cube.extract(tau_constraint & plev_constraint)
-    coord_names = [
-        coord.standard_name for coord in new_cube.coords()
-        if len(coord.points) > 1
-    ]
-    if 'atmosphere_optical_thickness_due_to_cloud' in coord_names:
-        new_cube = new_cube.collapsed(
-            'atmosphere_optical_thickness_due_to_cloud', iris.analysis.SUM)
-    if 'air_pressure' in coord_names:
-        new_cube = new_cube.collapsed('air_pressure', iris.analysis.SUM)
+    new_cube = clisccp_cube.extract(tau_constraint & plev_constraint)
+    for coord_name in ('atmosphere_optical_thickness_due_to_cloud',
+                       'air_pressure'):
+        if any(coord.shape[0] > 1 for coord in new_cube.coords(coord_name)):
+            new_cube = new_cube.collapsed(coord_name, iris.analysis.SUM)
 
     return new_cube
 
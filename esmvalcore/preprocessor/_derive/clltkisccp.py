@@ -6,6 +6,11 @@ from ._baseclass import DerivedVariableBase
 from ._shared import cloud_area_fraction
 
 
+TAU_CONSTRAINT = Constraint(
+    atmosphere_optical_thickness_due_to_cloud=lambda t: t > 23.)
+PLEV_CONSTRAINT = Constraint(air_pressure=lambda p: p > 68000.)
+
+
 class DerivedVariable(DerivedVariableBase):
     """Derivation of variable `clltkisccp`."""
 
@@ -18,8 +23,5 @@ class DerivedVariable(DerivedVariableBase):
     @staticmethod
     def calculate(cubes):
         """Compute ISCCP low level thick cloud area fraction."""
-        tau = Constraint(
-            atmosphere_optical_thickness_due_to_cloud=lambda t: t > 23.)
-        plev = Constraint(air_pressure=lambda p: p > 68000.)
-
-        return cloud_area_fraction(cubes, tau, plev)
+        return cloud_area_fraction(cubes, TAU_CONSTRAINT,
+                                   PLEV_CONSTRAINT)
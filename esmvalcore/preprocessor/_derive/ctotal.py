@@ -1,7 +1,5 @@
 """Derivation of variable `ctotal`."""
 
-import iris
-
 from iris import Constraint
 
 from ._baseclass import DerivedVariableBase
@@ -41,17 +39,24 @@ class DerivedVariable(DerivedVariableBase):
     @staticmethod
     def calculate(cubes):
         """Compute total ecosystem carbon storage."""
-        try:
-            c_soil_cube = cubes.extract_cube(
-                Constraint(name='soil_carbon_content'))
-        except iris.exceptions.ConstraintMismatchError:
-            try:
-                c_soil_cube = cubes.extract_cube(
-                    Constraint(name='soil_mass_content_of_carbon'))
-            except iris.exceptions.ConstraintMismatchError:
-                raise ValueError(f"No cube from {cubes} can be loaded with "
-                                 f"standard name CMIP5: soil_carbon_content "
-                                 f"or CMIP6: soil_mass_content_of_carbon")
+        # Build one name lookup instead of probing the cube list with
+        # repeated extract passes.
+        cubes_by_name = {}
+        for cube in cubes:
+            for name in (cube.standard_name, cube.long_name, cube.var_name):
+                if name:
+                    cubes_by_name[name] = cube
+
+        c_soil_cube = None
+        for soil_name in ('soil_carbon_content',
+                          'soil_mass_content_of_carbon'):
+            if soil_name in cubes_by_name:
+                c_soil_cube = cubes_by_name[soil_name]
+                break
+        if c_soil_cube is None:
+            raise ValueError(f"No cube from {cubes} can be loaded with "
+                             f"standard name CMIP5: soil_carbon_content "
+                             f"or CMIP6: soil_mass_content_of_carbon")
         c_veg_cube = cubes.extract_cube(
             Constraint(name='vegetation_carbon_content'))
         c_total_cube = c_soil_cube + c_veg_cube
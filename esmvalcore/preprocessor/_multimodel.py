@@ -41,7 +41,7 @@ def _quantile(data, axis, quantile):
     discussion: https://github.com/SciTools/iris/pull/625
     """
     # Ensure that the target axis is the last dimension.
-    data = np.rollaxis(data, axis, start=data.ndim)
+    data = np.moveaxis(data, axis, -1)
     shape = data.shape[:-1]
     # Flatten any leading dimensions.
     if shape:
@@ -62,11 +62,8 @@ def _quantile(data, axis, quantile):
     return result
 
 
-def _compute_statistic(data, statistic_name):
-    """Compute multimodel statistic."""
-    data = np.ma.array(data)
-    statistic = data[0]
-
+def _resolve_statistic_function(statistic_name):
+    """Return the reduction function belonging to `statistic_name`."""
     if statistic_name == 'median':
         statistic_function = np.ma.median
     elif statistic_name == 'mean':
@@ -83,6 +80,14 @@ def _compute_statistic(data, statistic_name):
         statistic_function = partial(_quantile, quantile=quantile)
     else:
         raise ValueError(f'No such statistic: `{statistic_name}`')
+    return statistic_function
+
+
+def _compute_statistic(data, statistic_name):
+    """Compute multimodel statistic."""
+    data = np.ma.array(data)
+    statistic = data[0]
+    statistic_function = _resolve_statistic_function(statistic_name)
 
     # no plevs
     if len(data[0].shape) < 3:
@@ -210,9 +215,10 @@ def _unify_time_coordinates(cubes):
     for cube in cubes:
         # Extract date info from cube
         coord = cube.coord('time')
-        years = [p.year for p in coord.units.num2date(coord.points)]
-        months = [p.month for p in coord.units.num2date(coord.points)]
-        days = [p.day for p in coord.units.num2date(coord.points)]
+        cube_dates = coord.units.num2date(coord.points)
+        years = [p.year for p in cube_dates]
+        months = [p.month for p in cube_dates]
+        days = [p.day for p in cube_dates]
 
         # Reconstruct default calendar
         if 0 not in np.diff(years):
@@ -242,50 +248,79 @@ def _unify_time_coordinates(cubes):
                 "support sub-daily data.")
 
         # Update the cubes' time coordinate (both point values and the units!)
-        cube.coord('time').points = t_unit.date2num(dates)
-        cube.coord('time').units = t_unit
-        cube.coord('time').bounds = None
-        cube.coord('time').guess_bounds()
+        new_points = t_unit.date2num(dates)
+        if (coord.units != t_unit
+                or not np.array_equal(coord.points, new_points)):
+            coord.points = new_points
+            coord.units = t_unit
+        # Always reset the bounds: existing bounds (e.g. month boundaries
+        # set by regrid_time) may differ from the guessed ones.
+        coord.bounds = None
+        coord.guess_bounds()
+
+
+def _resolve_span(time_spans, span):
+    """Resolve the output time points for `span` from the cubes' times."""
+    if span == 'overlap':
+        return reduce(np.intersect1d, time_spans)
+    if span == 'full':
+        return reduce(np.union1d, time_spans)
+    raise ValueError(
+        "Unexpected value for span {}, choose from 'overlap', 'full'".format(
+            span))
 
 
-def _get_time_slice(cubes, time):
-    """Fill time slice array with cubes' data if time in cube, else mask."""
-    time_slice = []
-    for cube in cubes:
-        cube_time = cube.coord('time').points
-        if time in cube_time:
-            idx = int(np.argwhere(cube_time == time))
-            subset = cube.data[idx]
-        else:
-            subset = np.ma.empty(list(cube.shape[1:]))
-            subset.mask = True
-        time_slice.append(subset)
-    return time_slice
+def _stack_cubes(cubes, new_times):
+    """Stack the cubes' data along a new leading axis.
 
+    Return a masked array of shape ``(n_cubes, n_times, ...)``; times
+    missing from a cube are fully masked in its row.
+    """
+    stacked = np.ma.masked_all([len(cubes), len(new_times)] +
+                               list(cubes[0].shape[1:]))
+    for i, cube in enumerate(cubes):
+        cube_times = cube.coord('time').points
+        stacked[i, np.isin(new_times, cube_times)] = (
+            cube.data[np.isin(cube_times, new_times)])
+    return stacked
 
-def _assemble_data(cubes, statistic, span='overlap'):
-    """Get statistical data in iris cubes."""
-    # New time array representing the union or intersection of all cubes
-    time_spans = [cube.coord('time').points for cube in cubes]
-    if span == 'overlap':
-        new_times = reduce(np.intersect1d, time_spans)
-    elif span == 'full':
-        new_times = reduce(np.union1d, time_spans)
+
+def _invalid_time_steps(stacked):
+    """Flag time steps for which less than two datasets have valid data.
+
+    These are masked in every statistic, so compute them only once per
+    stacked array instead of once per statistic.
+    """
+    n_valid = np.sum(~np.ma.getmaskarray(stacked).reshape(
+        stacked.shape[0], stacked.shape[1], -1).all(axis=-1),
+                     axis=0)
+    return n_valid <= 1
+
+
+def _assemble_data(template, stacked, new_times, statistic,
+                   invalid_times=None):
+    """Compute `statistic` over the stacked data and build its cube."""
     n_times = len(new_times)
 
     # Target array to populate with computed statistics
-    new_shape = [n_times] + list(cubes[0].shape[1:])
+    new_shape = [n_times] + list(template.shape[1:])
     stats_data = np.ma.zeros(new_shape, dtype=np.dtype('float32'))
 
-    # Realize all cubes at once instead of separately for each time slice
-    _ = [cube.data for cube in cubes]
-
-    # Make time slices and compute stats
-    for i, time in enumerate(new_times):
-        time_data = _get_time_slice(cubes, time)
-        stats_data[i] = _compute_statistic(time_data, statistic)
+    if template.ndim < 4:
+        # no plevs: reduce over the cube axis for all times at once
+        statistic_function = _resolve_statistic_function(statistic)
+        result = np.ma.asarray(statistic_function(stacked, axis=0))
+        if invalid_times is not None:
+            result[invalid_times] = np.ma.masked
+        stats_data[...] = result
+    else:
+        # plevs: compute stats per time slice; pass a copy because
+        # _compute_statistic writes its result into the slice's first
+        # row, which would corrupt the shared stacked array
+        for i in range(n_times):
+            stats_data[i] = _compute_statistic(
+                np.ma.array(stacked[:, i], copy=True), statistic)
 
-    template = cubes[0]
     stats_cube = _put_in_cube(template, stats_data, statistic, new_times)
     return stats_cube
 
@@ -334,28 +369,31 @@ def _multicube_statistics(cubes, statistics, span):
     # Reset time coordinates and make cubes share the same calendar
     _unify_time_coordinates(cubes)
 
-    # Check whether input is valid
+    # Check whether input is valid and resolve the output time points
+    time_spans = [cube.coord('time').points for cube in cubes]
+    new_times = _resolve_span(time_spans, span)
     if span == 'overlap':
-        # check if we have any time overlap
-        times = [cube.coord('time').points for cube in cubes]
-        overlap = reduce(np.intersect1d, times)
-        if len(overlap) <= 1:
+        if len(new_times) <= 1:
             logger.info("Time overlap between cubes is none or a single point."
                         "check datasets: will not compute statistics.")
             return cubes
         logger.debug("Using common time overlap between "
                      "datasets to compute statistics.")
-    elif span == 'full':
+    else:
         logger.debug("Using full time spans to compute statistics.")
+
+    # Stack the cubes' data once; all statistics reduce the same array
+    stacked = _stack_cubes(cubes, new_times)
+    if 1 < cubes[0].ndim < 4:
+        invalid_times = _invalid_time_steps(stacked)
     else:
-        raise ValueError(
-            "Unexpected value for span {}, choose from 'overlap', 'full'".
-            format(span))
+        invalid_times = None
 
     # Compute statistics
     statistics_cubes = {}
     for statistic in statistics:
-        statistic_cube = _assemble_data(cubes, statistic, span)
+        statistic_cube = _assemble_data(cubes[0], stacked, new_times,
+                                        statistic, invalid_times)
         statistics_cubes[statistic] = statistic_cube
 
     return statistics_cubes
@@ -11,6 +11,7 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from setuptools import Command, setup
@@ -82,9 +83,11 @@ REQUIREMENTS = {
 
 def discover_python_files(paths, ignore):
     """Discover Python files."""
+    ignore = [re.compile(pattern) for pattern in ignore]
+
     def _ignore(path):
         """Return True if `path` should be ignored, False otherwise."""
-        return any(re.match(pattern, path) for pattern in ignore)
+        return any(pattern.match(path) for pattern in ignore)
 
     for path in sorted(set(paths)):
         for root, _, files in os.walk(path):
@@ -156,22 +159,25 @@ class RunLinter(CustomCommand):
         sys.exit(errno)
 
 
+@lru_cache()
+def read_zenodo(filename):
+    """Read and parse the .zenodo.json file only once."""
+    with Path(filename).open() as file:
+        return json.load(file)
+
+
 def read_authors(filename):
     """Read the list of authors from .zenodo.json file."""
-    with Path(filename).open() as file:
-        info = json.load(file)
-        authors = []
-        for author in info['creators']:
-            name = ' '.join(author['name'].split(',')[::-1]).strip()
-            authors.append(name)
-        return ', '.join(authors)
+    authors = []
+    for author in read_zenodo(filename)['creators']:
+        name = ' '.join(author['name'].split(',')[::-1]).strip()
+        authors.append(name)
+    return ', '.join(authors)
 
 
 def read_description(filename):
     """Read the description from .zenodo.json file."""
-    with Path(filename).open() as file:
-        info = json.load(file)
-        return info['description']
+    return read_zenodo(filename)['description']
 
 
 setup(
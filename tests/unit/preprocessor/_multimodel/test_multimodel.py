@@ -1,6 +1,7 @@
 """Unit test for :func:`esmvalcore.preprocessor._multimodel`"""
 
 from datetime import datetime
+from functools import lru_cache
 
 import iris
 import numpy as np
@@ -21,12 +22,20 @@ CALENDAR_OPTIONS = ('360_day', '365_day', 'gregorian', 'proleptic_gregorian',
 
 def assert_array_allclose(this, other):
     """Assert that array `this` is close to array `other`."""
-    if np.ma.isMaskedArray(this) or np.ma.isMaskedArray(other):
-        np.testing.assert_array_equal(this.mask, other.mask)
+    # `getmaskarray` returns `False` broadcastable for plain ndarrays, so
+    # no type check is needed before comparing the masks.
+    np.testing.assert_array_equal(np.ma.getmaskarray(this),
+                                  np.ma.getmaskarray(other))
 
     np.testing.assert_allclose(this, other)
 
 
+@lru_cache()
+def get_unit(offset, calendar):
+    """Return a time unit; cached because Unit construction is expensive."""
+    return Unit(offset, calendar=calendar)
+
+
 def timecoord(frequency,
               calendar='gregorian',
               offset='days since 1850-01-01',
@@ -44,7 +53,7 @@ def timecoord(frequency,
     elif frequency == 'yearly':
         dates = [datetime(1850, 7, i, 0, 0, 0) for i in time_points]
 
-    unit = Unit(offset, calendar=calendar)
+    unit = get_unit(offset, calendar)
     points = unit.date2num(dates)
     return iris.coords.DimCoord(points, standard_name='time', units=unit)
 
@@ -80,7 +89,7 @@ def generate_cube_from_dates(
     if isinstance(dates, str):
         time = timecoord(dates, calendar, offset=offset, num=len_data)
     else:
-        unit = Unit(offset, calendar=calendar)
+        unit = get_unit(offset, calendar)
         time = iris.coords.DimCoord(unit.date2num(dates),
                                     standard_name='time',
                                     units=unit)
@@ -90,9 +99,9 @@ def generate_cube_from_dates(
                 var_name=var_name)
 
 
-def get_cubes_for_validation_test(frequency):
-    """Set up cubes used for testing multimodel statistics."""
-
+@lru_cache()
+def _build_cubes_for_validation_test(frequency):
+    """Build the validation cubes for `frequency` only once."""
     # Simple 1d cube with standard time cord
     cube1 = generate_cube_from_dates(frequency)
 
@@ -107,7 +116,17 @@ def get_cubes_for_validation_test(frequency):
                                      len_data=2,
                                      fill_val=9)
 
-    return [cube1, cube2, cube3]
+    return (cube1, cube2, cube3)
+
+
+def get_cubes_for_validation_test(frequency):
+    """Set up cubes used for testing multimodel statistics.
+
+    multi_model_statistics updates the cubes in-place, so hand out
+    copies of the cached originals.
+    """
+    cubes = _build_cubes_for_validation_test(frequency)
+    return [cube.copy() for cube in cubes]
 
 
 VALIDATION_DATA_SUCCESS = (
@@ -141,6 +160,16 @@ VALIDATION_DATA_SUCCESS = (
 )
 
 
+@lru_cache()
+def _expected_as_masked_array(expected):
+    """Build the expected masked array only once per table entry.
+
+    Each entry of ``VALIDATION_DATA_SUCCESS`` is reused for every
+    frequency, so cache the conversion on the (hashable) tuple.
+    """
+    return np.ma.array(expected, mask=False)
+
+
 @pytest.mark.parametrize('frequency', FREQUENCY_OPTIONS)
 @pytest.mark.parametrize('span, statistics, expected', VALIDATION_DATA_SUCCESS)
 def test_multimodel_statistics(frequency, span, statistics, expected):
@@ -163,10 +192,45 @@ def test_multimodel_statistics(frequency, span, statistics, expected):
     assert isinstance(result, dict)
     assert set(result.keys()) == set(statistics)
 
-    for i, statistic in enumerate(statistics):
-        result_cube = result[statistic]
-        expected_data = np.ma.array(expected[i], mask=False)
-        assert_array_allclose(result_cube.data, expected_data)
+    # Compare all statistics in one stacked assertion
+    result_data = np.ma.stack(
+        [result[statistic].data for statistic in statistics])
+    expected_data = _expected_as_masked_array(expected)
+    assert_array_allclose(result_data, expected_data)
+
+
+def generate_cube_4d(fill_val):
+    """Generate a (time, plev, lat, lon) test cube filled with `fill_val`."""
+    time = timecoord('monthly')
+    plev = iris.coords.DimCoord([2.5e4, 5.0e4],
+                                standard_name='air_pressure',
+                                units='Pa')
+    lat = iris.coords.DimCoord([0.],
+                               standard_name='latitude',
+                               units='degrees_north')
+    lon = iris.coords.DimCoord([0.],
+                               standard_name='longitude',
+                               units='degrees_east')
+    data = np.full((3, 2, 1, 1), fill_val, dtype=np.float32)
+    return Cube(data,
+                dim_coords_and_dims=[(time, 0), (plev, 1), (lat, 2),
+                                     (lon, 3)])
+
+
+@pytest.mark.parametrize('span', SPAN_OPTIONS)
+def test_multimodel_statistics_4d_multiple_stats(span):
+    """Test multiple statistics on 4d (plev) data.
+
+    Regression test: computing one statistic must not corrupt the
+    shared input data for the statistics computed after it.
+    """
+    cubes = [generate_cube_4d(fill_val) for fill_val in (1, 5, 9)]
+
+    result = multi_model_statistics(cubes, span, ('mean', 'min', 'max'))
+
+    assert_array_allclose(result['mean'].data, np.full((3, 2, 1, 1), 5.))
+    assert_array_allclose(result['min'].data, np.full((3, 2, 1, 1), 1.))
+    assert_array_allclose(result['max'].data, np.full((3, 2, 1, 1), 9.))
 
 
 @pytest.mark.parametrize('calendar1, calendar2, expected', (
@@ -217,11 +281,11 @@ def test_edge_case_different_time_offsets(span):
     assert time_coord.units.origin == 'days since 1850-01-01'
 
     desired = np.array((14., 45., 73.))
-    np.testing.assert_array_equal(time_coord.points, desired)
+    assert np.array_equal(time_coord.points, desired)
 
     # input cubes are updated in-place
     for cube in cubes:
-        np.testing.assert_array_equal(cube.coord('time').points, desired)
+        assert np.array_equal(cube.coord('time').points, desired)
 
 
 def generate_cubes_with_non_overlapping_timecoords():
@@ -294,11 +358,11 @@ def test_edge_case_time_not_in_middle_of_months(span):
     time_coord = result_cube.coord('time')
 
     desired = np.array((14., 45., 73.))
-    np.testing.assert_array_equal(time_coord.points, desired)
+    assert np.array_equal(time_coord.points, desired)
 
     # input cubes are updated in-place
     for cube in cubes:
-        np.testing.assert_array_equal(cube.coord('time').points, desired)
+        assert np.array_equal(cube.coord('time').points, desired)
 
 
 @pytest.mark.parametrize('span', SPAN_OPTIONS)